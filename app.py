@@ -9,7 +9,7 @@ Features (per guidelines):
 - Financial Reports (monthly/yearly totals: income, expense, savings)
 - Budgeting (set monthly category budgets, warn when exceeded)
 - Data Persistence (SQLite)
-- Backup & Restore (copy/replace DB file)
+- Backup & Restore (SQLite online backup API)
 - Error handling & user-friendly CLI
 - Unit Tests (run with: python app.py --test)
 
@@ -28,43 +28,141 @@ import getpass
 import hmac
 import hashlib
 import os
-import shutil
+import queue
+import re
 import sqlite3
 import sys
 import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Iterator, Callable
 
 # ----------------------------- Constants ------------------------------------
 DEFAULT_DB_PATH = os.environ.get("PFM_DB", "pfm.sqlite3")
 DATE_FMT = "%Y-%m-%d"  # ISO format
 MONTH_FMT = "%Y-%m"    # e.g., 2025-09
+# Validation patterns for the two formats above (much cheaper than strptime).
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_MONTH_RE = re.compile(r"([0-9]{4})-([0-9]{2})")
+
+
+def _pbkdf2_iters_from_env(default: int = 200_000) -> int:
+    """Read PFM_PBKDF2_ITERS; a malformed value is reported and the default used."""
+    raw = os.environ.get("PFM_PBKDF2_ITERS")
+    if raw is None:
+        return default
+    try:
+        iters = int(raw)
+    except ValueError:
+        iters = 0
+    if iters < 1:
+        print(f"Ignoring PFM_PBKDF2_ITERS={raw!r} (expected a positive integer); using {default}.", file=sys.stderr)
+        return default
+    return iters
+
+
+# PBKDF2 work factor. Hashes are only verifiable with the count they were made
+# with, so keep this stable for a given database; the test suite lowers it.
+PBKDF2_ITERS = _pbkdf2_iters_from_env()
 
 # ----------------------------- Utilities ------------------------------------
 
-def hash_password(password: str, salt: Optional[bytes] = None) -> Tuple[bytes, bytes]:
-    """Return (salt, hash) using PBKDF2-HMAC-SHA256."""
+def _pbkdf2(pwd_bytes: bytes, salt: bytes, iterations: int) -> bytes:
+    # hashlib delegates to OpenSSL (>= 1.1 uses SHA-NI where the CPU has it)
+    # and releases the GIL for the duration of the call.
+    return hashlib.pbkdf2_hmac("sha256", pwd_bytes, salt, iterations)
+
+
+def hash_password(password: str, salt: Optional[bytes] = None, iterations: Optional[int] = None) -> Tuple[bytes, bytes]:
+    """Return (salt, hash) using PBKDF2-HMAC-SHA256 (defaults to PBKDF2_ITERS rounds)."""
     if salt is None:
         salt = os.urandom(16)
-    pwd_hash = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 200_000)
+    if iterations is None:
+        iterations = PBKDF2_ITERS
+    pwd_hash = _pbkdf2(password.encode("utf-8"), salt, iterations)
     return salt, pwd_hash
 
 
-def verify_password(password: str, salt: bytes, pwd_hash: bytes) -> bool:
-    _salt, new_hash = hash_password(password, salt)
+def verify_password(password: str, salt: bytes, pwd_hash: bytes, iterations: Optional[int] = None) -> bool:
+    if iterations is None:
+        iterations = PBKDF2_ITERS
+    new_hash = _pbkdf2(password.encode("utf-8"), salt, iterations)
     return hmac.compare_digest(pwd_hash, new_hash)
 
 
+def verify_passwords(items: List[Tuple[str, bytes, bytes]], max_workers: Optional[int] = None) -> List[bool]:
+    """Verify many (password, salt, hash) triples concurrently; results keep input order."""
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda item: verify_password(*item), items))
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    """Days since 1970-01-01 in the proleptic Gregorian calendar.
+
+    Pure arithmetic (no dt.date), so period bounds for years 0 and 10000 are
+    still representable when a report asks for year 0000 or 9999.
+    """
+    year -= month <= 2
+    era = year // 400
+    yoe = year - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _to_days(s: str) -> int:
+    """'YYYY-MM-DD' -> days since 1970-01-01 (the stored form of transactions.tdate)."""
+    return _days_from_civil(int(s[:4]), int(s[5:7]), int(s[8:10]))
+
+
+def month_bounds(month: str) -> Tuple[int, int]:
+    """Return the half-open day range [first day, first day of next month) for 'YYYY-MM'.
+
+    Raises ValueError for anything else, so a bad filter fails with a clear message.
+    """
+    m = _MONTH_RE.fullmatch(month)
+    if not m or not 1 <= int(m.group(2)) <= 12:
+        raise ValueError(f"Invalid month {month!r}; expected YYYY-MM.")
+    year, mon = int(m.group(1)), int(m.group(2))
+    nxt_year, nxt_mon = (year + 1, 1) if mon == 12 else (year, mon + 1)
+    return _days_from_civil(year, mon, 1), _days_from_civil(nxt_year, nxt_mon, 1)
+
+
+def year_bounds(year: int) -> Tuple[int, int]:
+    """Return the half-open day range [Jan 1, Jan 1 of next year) for `year`."""
+    return _days_from_civil(year, 1, 1), _days_from_civil(year + 1, 1, 1)
+
+
+def _today_strs() -> Tuple[str, str, int]:
+    """Return today's (YYYY-MM-DD, YYYY-MM, year) from a single clock read."""
+    d = dt.date.today()
+    today = d.strftime(DATE_FMT)
+    return today, today[:7], d.year
+
+
+def _valid_date(s: str) -> bool:
+    """True if `s` is a real calendar date in strict YYYY-MM-DD form."""
+    m = _DATE_RE.fullmatch(s)
+    if not m:
+        return False
+    y, mo, d = map(int, m.groups())
+    return y >= 1 and 1 <= mo <= 12 and 1 <= d <= calendar.monthrange(y, mo)[1]
+
+
+def _valid_month(s: str) -> bool:
+    """True if `s` is a month in strict YYYY-MM form."""
+    m = _MONTH_RE.fullmatch(s)
+    return bool(m) and int(m.group(1)) >= 1 and 1 <= int(m.group(2)) <= 12
+
+
 def input_date(prompt: str, default: Optional[str] = None) -> str:
     while True:
         raw = input(f"{prompt} [{default or 'YYYY-MM-DD'}]: ").strip() or (default or "")
-        try:
-            if not raw:
-                raise ValueError
-            dt.datetime.strptime(raw, DATE_FMT)
+        if _valid_date(raw):
             return raw
-        except ValueError:
-            print("  ! Please enter a valid date in YYYY-MM-DD format.")
+        print("  ! Please enter a valid date in YYYY-MM-DD format.")
 
 
 def input_float(prompt: str, min_value: Optional[float] = None) -> float:
@@ -85,179 +183,420 @@ def pause(msg: str = "Press Enter to continue..."):
 
 # ----------------------------- Database Layer -------------------------------
 
-class Database:
-    def __init__(self, path: str = DEFAULT_DB_PATH):
+# Connection-scoped settings; applied to every connection by _connect().
+_CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;      -- ~20 MB page cache
+    PRAGMA mmap_size = 268435456;    -- 256 MB
+    PRAGMA busy_timeout = 5000;      -- ms
+"""
+
+_SCHEMA_SQL = """
+    PRAGMA journal_mode = WAL;       -- persistent: stored in the database file
+
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        salt BLOB NOT NULL,
+        password_hash BLOB NOT NULL,
+        created_at TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        ttype TEXT NOT NULL CHECK(ttype IN ('income','expense')),
+        category TEXT NOT NULL,
+        amount REAL NOT NULL CHECK(amount >= 0),
+        tdate INTEGER NOT NULL,  -- days since 1970-01-01
+        note TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS budgets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        category TEXT NOT NULL,
+        month TEXT NOT NULL,  -- YYYY-MM
+        monthly_limit REAL NOT NULL CHECK(monthly_limit >= 0),
+        UNIQUE(user_id, category, month)
+    );
+
+    CREATE INDEX IF NOT EXISTS ix_tx_user_date ON transactions(user_id, tdate);
+    CREATE INDEX IF NOT EXISTS ix_tx_user_cat_date ON transactions(user_id, category, tdate);
+"""
+
+SCHEMA_VERSION = 1
+
+# v0 -> v1: transactions.tdate TEXT 'YYYY-MM-DD' -> INTEGER days since epoch.
+_MIGRATE_V1_CREATE_SQL = """
+    CREATE TABLE transactions_v1 (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        ttype TEXT NOT NULL CHECK(ttype IN ('income','expense')),
+        category TEXT NOT NULL,
+        amount REAL NOT NULL CHECK(amount >= 0),
+        tdate INTEGER NOT NULL,
+        note TEXT
+    )
+"""
+_MIGRATE_V1_FINISH_SQL = (
+    "DROP TABLE transactions",
+    "ALTER TABLE transactions_v1 RENAME TO transactions",
+    "CREATE INDEX ix_tx_user_date ON transactions(user_id, tdate)",
+    "CREATE INDEX ix_tx_user_cat_date ON transactions(user_id, category, tdate)",
+)
+
+
+def _legacy_parts(s: str, count: int, row_id: int) -> List[int]:
+    """Split a v0 'Y-M[-D]' string into ints; strptime let zero padding be omitted."""
+    try:
+        parts = [int(part) for part in s.strip().split("-")]
+    except (AttributeError, ValueError):
+        parts = []
+    if len(parts) != count:
+        raise ValueError(f"Cannot migrate date {s!r} (row {row_id}).")
+    return parts
+
+
+def _migrate_v1(conn: sqlite3.Connection) -> None:
+    """Convert v0 text dates in Python, so unpadded values like '2025-9-5' survive.
+
+    Everything is parsed before the first write and applied in one transaction:
+    a value that cannot be read leaves the database untouched.
+    """
+    tx_rows = []
+    for row_id, user_id, ttype, category, amount, tdate, note in conn.execute(
+        "SELECT id, user_id, ttype, category, amount, tdate, note FROM transactions"
+    ):
+        tdays = _days_from_civil(*_legacy_parts(tdate, 3, row_id))
+        tx_rows.append((row_id, user_id, ttype, category, amount, tdays, note))
+    budget_months = []
+    for row_id, month in conn.execute("SELECT id, month FROM budgets"):
+        year, mon = _legacy_parts(month, 2, row_id)
+        padded = f"{year:04d}-{mon:02d}"
+        if padded != month:
+            budget_months.append((padded, row_id))
+    conn.execute("BEGIN")
+    try:
+        conn.execute(_MIGRATE_V1_CREATE_SQL)
+        conn.executemany(
+            "INSERT INTO transactions_v1(id, user_id, ttype, category, amount, tdate, note) VALUES(?,?,?,?,?,?,?)",
+            tx_rows,
+        )
+        for sql in _MIGRATE_V1_FINISH_SQL:
+            conn.execute(sql)
+        # '2025-9' and '2025-09' name the same month; the unpadded row wins a clash.
+        conn.executemany("UPDATE OR REPLACE budgets SET month = ? WHERE id = ?", budget_months)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _init_db(conn: sqlite3.Connection) -> None:
+    """Create missing tables and migrate an older database to SCHEMA_VERSION."""
+    conn.executescript(_SCHEMA_SQL)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 1:
+        cols = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(transactions)")}
+        if cols["tdate"].upper() == "TEXT":
+            _migrate_v1(conn)
+    if version < SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _connect(path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open `path` with the row factory and per-connection pragmas every caller relies on."""
+    conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
+class DatabasePool:
+    """One writer plus a fixed set of read-only connections, for multi-threaded callers.
+
+    Pass one to Database(pool=...) to route its reads and writes through here.
+    WAL mode lets readers run alongside the single writer. File databases only:
+    every ':memory:' connection would be a separate, empty database.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, readers: int = 4):
+        if path == ":memory:":
+            raise ValueError("DatabasePool requires a file-backed database.")
         self.path = path
-        self.conn = sqlite3.connect(self.path)
-        self.conn.row_factory = sqlite3.Row
-        self._init_schema()
+        self.write_conn = _connect(path, check_same_thread=False)
+        _init_db(self.write_conn)
+        self._write_lock = threading.Lock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        # Every reader ever opened, so close() reaches those still on loan too.
+        self._all_readers: List[sqlite3.Connection] = []
+        for _ in range(readers):
+            conn = _connect(path, check_same_thread=False)
+            conn.execute("PRAGMA query_only = 1")
+            self._all_readers.append(conn)
+            self._readers.put(conn)
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, blocking until one is free."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer exclusively without starting a transaction (backup/restore)."""
+        with self._write_lock:
+            yield self.write_conn
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer for one transaction; commits on success, rolls back on error."""
+        with self.writer() as conn, conn:
+            yield conn
+
+    def close(self) -> None:
+        self.write_conn.close()
+        for conn in self._all_readers:
+            conn.close()
+
+
+class Database:
+    # SQL text is kept in class constants so every call passes the identical
+    # string and hits sqlite3's per-connection prepared-statement cache.
+    _SQL_CREATE_USER = "INSERT INTO users(username, salt, password_hash, created_at) VALUES(?,?,?,?)"
+    _SQL_GET_USER = "SELECT id, salt, password_hash FROM users WHERE username = ?"
+    _SQL_ADD_TX = """
+        INSERT INTO transactions(user_id, ttype, category, amount, tdate, note)
+        VALUES(?,?,?,?,?,?)
+    """
+    _SQL_DELETE_TX = "DELETE FROM transactions WHERE id = ? AND user_id = ?"
+    _SQL_LIST_TX_MONTH = (
+        "SELECT id, date(tdate * 86400, 'unixepoch') AS tdate, ttype, category, amount, note FROM transactions"
+        " WHERE user_id = ? AND tdate >= ? AND tdate < ? ORDER BY transactions.tdate DESC, id DESC LIMIT ? OFFSET ?"
+    )
+    _SQL_LIST_TX_ALL = (
+        "SELECT id, date(tdate * 86400, 'unixepoch') AS tdate, ttype, category, amount, note FROM transactions"
+        " WHERE user_id = ? ORDER BY transactions.tdate DESC, id DESC LIMIT ? OFFSET ?"
+    )
+    _SQL_RANGE_TOTALS = """
+        SELECT COALESCE(SUM(CASE WHEN ttype='income' THEN amount END),0) AS inc,
+               COALESCE(SUM(CASE WHEN ttype='expense' THEN amount END),0) AS exp
+        FROM transactions
+        WHERE user_id = ? AND tdate >= ? AND tdate < ?
+    """
+    _SQL_MONTHLY_BREAKDOWN = """
+        SELECT CAST(strftime('%m', tdate * 86400, 'unixepoch') AS INTEGER) AS month,
+               COALESCE(SUM(CASE WHEN ttype='income' THEN amount END),0) AS inc,
+               COALESCE(SUM(CASE WHEN ttype='expense' THEN amount END),0) AS exp
+        FROM transactions
+        WHERE user_id = ? AND tdate >= ? AND tdate < ?
+        GROUP BY month
+    """
+    _SQL_CATEGORY_MONTH_EXPENSE = """
+        SELECT COALESCE(SUM(amount),0)
+        FROM transactions
+        WHERE user_id = ? AND ttype='expense' AND category = ? AND tdate >= ? AND tdate < ?
+    """
+    _SQL_CATEGORY_MONTH_EXPENSES = """
+        SELECT category, SUM(amount)
+        FROM transactions
+        WHERE user_id = ? AND ttype='expense' AND tdate >= ? AND tdate < ?
+        GROUP BY category
+    """
+    _SQL_SET_BUDGET = """
+        INSERT INTO budgets(user_id, category, month, monthly_limit)
+        VALUES(?,?,?,?)
+        ON CONFLICT(user_id, category, month)
+        DO UPDATE SET monthly_limit = excluded.monthly_limit
+    """
+    _SQL_GET_BUDGET = "SELECT monthly_limit FROM budgets WHERE user_id = ? AND category = ? AND month = ?"
+    _SQL_LIST_BUDGETS_MONTH = (
+        "SELECT category, month, monthly_limit FROM budgets WHERE user_id = ? AND month = ? ORDER BY category"
+    )
+    _SQL_LIST_BUDGETS_ALL = (
+        "SELECT category, month, monthly_limit FROM budgets WHERE user_id = ? ORDER BY month DESC, category"
+    )
+
+    # Aggregates read by position; their cursors return plain tuples instead
+    # of sqlite3.Row objects.
+    _TUPLE_QUERIES = frozenset({
+        _SQL_RANGE_TOTALS, _SQL_MONTHLY_BREAKDOWN, _SQL_CATEGORY_MONTH_EXPENSE, _SQL_CATEGORY_MONTH_EXPENSES,
+    })
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, pool: Optional[DatabasePool] = None):
+        """Open `path` on a single connection, or, given a `pool`, use its connections.
+
+        Without a pool every call shares `self.conn` (the only option for ':memory:').
+        With one, reads borrow a pooled reader and writes go through the pool's writer;
+        `self.conn` is then the pool's writer, to be reached through exclusive() only.
+        """
+        self.pool = pool
+        self._cursors: Dict[Tuple[sqlite3.Connection, str], sqlite3.Cursor] = {}
+        if pool is None:
+            self.path = path
+            self.conn = _connect(path)
+            self._init_schema()
+        else:
+            self.path = pool.path
+            self.conn = pool.write_conn
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        if self.pool is None:
+            yield self.conn
+        else:
+            with self.pool.read() as conn:
+                yield conn
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """One transaction: commits on success, rolls back on error."""
+        if self.pool is None:
+            with self.conn:
+                yield self.conn
+        else:
+            with self.pool.write() as conn:
+                yield conn
+
+    @contextmanager
+    def exclusive(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write connection for a whole-database operation (backup/restore).
+
+        With a pool this takes its writer lock, so it waits for any write in progress.
+        """
+        if self.pool is None:
+            yield self.conn
+        else:
+            with self.pool.writer() as conn:
+                yield conn
+
+    def _cursor(self, conn: sqlite3.Connection, sql: str) -> sqlite3.Cursor:
+        """Return the persistent cursor reserved for `sql` on `conn`."""
+        cur = self._cursors.get((conn, sql))
+        if cur is None:
+            cur = self._cursors[(conn, sql)] = conn.cursor()
+            if sql in self._TUPLE_QUERIES:
+                cur.row_factory = None
+        return cur
+
+    def _exec(self, conn: sqlite3.Connection, sql: str, params=()) -> sqlite3.Cursor:
+        cur = self._cursor(conn, sql)
+        cur.execute(sql, params)
+        return cur
 
     def _init_schema(self):
-        cur = self.conn.cursor()
-        cur.executescript(
-            """
-            PRAGMA foreign_keys = ON;
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                salt BLOB NOT NULL,
-                password_hash BLOB NOT NULL,
-                created_at TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                ttype TEXT NOT NULL CHECK(ttype IN ('income','expense')),
-                category TEXT NOT NULL,
-                amount REAL NOT NULL CHECK(amount >= 0),
-                tdate TEXT NOT NULL,  -- YYYY-MM-DD
-                note TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS budgets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                category TEXT NOT NULL,
-                month TEXT NOT NULL,  -- YYYY-MM
-                monthly_limit REAL NOT NULL CHECK(monthly_limit >= 0),
-                UNIQUE(user_id, category, month)
-            );
-            """
-        )
-        self.conn.commit()
+        _init_db(self.conn)
 
     # ------------------------- Users -------------------------
     def create_user(self, username: str, password: str) -> int:
         salt, pwd_hash = hash_password(password)
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO users(username, salt, password_hash, created_at) VALUES(?,?,?,?)",
-            (username, salt, pwd_hash, dt.datetime.utcnow().isoformat()),
-        )
-        self.conn.commit()
-        return cur.lastrowid
+        with self._writing() as conn:  # rolls back on IntegrityError, so no transaction is left open
+            cur = self._exec(conn, self._SQL_CREATE_USER, (username, salt, pwd_hash, dt.datetime.utcnow().isoformat()))
+            return cur.lastrowid
 
     def get_user(self, username: str) -> Optional[sqlite3.Row]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT * FROM users WHERE username = ?", (username,))
-        return cur.fetchone()
+        with self._reading() as conn:
+            return self._exec(conn, self._SQL_GET_USER, (username,)).fetchone()
 
     # ---------------------- Transactions ----------------------
     def add_transaction(self, user_id: int, ttype: str, category: str, amount: float, tdate: str, note: str = "") -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO transactions(user_id, ttype, category, amount, tdate, note)
-            VALUES(?,?,?,?,?,?)
-            """,
-            (user_id, ttype, category, amount, tdate, note),
-        )
-        self.conn.commit()
-        return cur.lastrowid
+        with self._writing() as conn:
+            cur = self._exec(conn, self._SQL_ADD_TX, (user_id, ttype, category, amount, _to_days(tdate), note))
+            return cur.lastrowid
+
+    def add_transactions_bulk(self, user_id: int, rows: List[Tuple[str, str, float, str, str]]) -> None:
+        """Insert many (ttype, category, amount, tdate, note) rows in one SQL transaction."""
+        with self._writing() as conn:
+            self._cursor(conn, self._SQL_ADD_TX).executemany(
+                self._SQL_ADD_TX,
+                ((user_id, ttype, category, amount, _to_days(tdate), note)
+                 for ttype, category, amount, tdate, note in rows),
+            )
 
     def update_transaction(self, tid: int, user_id: int, **fields) -> None:
         if not fields:
             return
+        if "tdate" in fields:
+            fields["tdate"] = _to_days(fields["tdate"])
         cols = ", ".join(f"{k} = ?" for k in fields)
         vals = list(fields.values()) + [tid, user_id]
-        cur = self.conn.cursor()
-        cur.execute(f"UPDATE transactions SET {cols} WHERE id = ? AND user_id = ?", vals)
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute(f"UPDATE transactions SET {cols} WHERE id = ? AND user_id = ?", vals)
 
     def delete_transaction(self, tid: int, user_id: int) -> None:
-        cur = self.conn.cursor()
-        cur.execute("DELETE FROM transactions WHERE id = ? AND user_id = ?", (tid, user_id))
-        self.conn.commit()
-
-    def list_transactions(self, user_id: int, month: Optional[str] = None) -> List[sqlite3.Row]:
-        cur = self.conn.cursor()
-        if month:
-            cur.execute(
-                "SELECT * FROM transactions WHERE user_id = ? AND substr(tdate,1,7) = ? ORDER BY tdate DESC, id DESC",
-                (user_id, month),
-            )
-        else:
-            cur.execute(
-                "SELECT * FROM transactions WHERE user_id = ? ORDER BY tdate DESC, id DESC",
-                (user_id,),
-            )
-        return cur.fetchall()
+        with self._writing() as conn:
+            self._exec(conn, self._SQL_DELETE_TX, (tid, user_id))
+
+    def list_transactions(self, user_id: int, month: Optional[str] = None,
+                          limit: Optional[int] = None, offset: int = 0) -> List[sqlite3.Row]:
+        """Return matching rows, newest first; `limit=None` means all.
+
+        Callers that may face many rows page with `limit`/`offset` (as the CLI does)
+        rather than streaming, so a pooled reader is never held between pages.
+        """
+        page = (-1 if limit is None else limit, offset)  # LIMIT -1: no limit
+        with self._reading() as conn:
+            if month:
+                cur = self._exec(conn, self._SQL_LIST_TX_MONTH, (user_id, *month_bounds(month), *page))
+            else:
+                cur = self._exec(conn, self._SQL_LIST_TX_ALL, (user_id, *page))
+            return cur.fetchall()
+
+    def _range_totals(self, user_id: int, start: int, end: int) -> Dict[str, float]:
+        with self._reading() as conn:
+            inc, exp = self._exec(conn, self._SQL_RANGE_TOTALS, (user_id, start, end)).fetchone()
+        return {"income": float(inc), "expense": float(exp), "savings": float(inc - exp)}
 
     def month_totals(self, user_id: int, month: str) -> Dict[str, float]:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT ttype, COALESCE(SUM(amount),0) as total
-            FROM transactions
-            WHERE user_id = ? AND substr(tdate,1,7) = ?
-            GROUP BY ttype
-            """,
-            (user_id, month),
-        )
-        data = {"income": 0.0, "expense": 0.0}
-        for row in cur.fetchall():
-            data[row[0]] = float(row[1])
-        return data
+        return self._range_totals(user_id, *month_bounds(month))
 
     def year_totals(self, user_id: int, year: int) -> Dict[str, float]:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT ttype, COALESCE(SUM(amount),0) as total
-            FROM transactions
-            WHERE user_id = ? AND substr(tdate,1,4) = ?
-            GROUP BY ttype
-            """,
-            (user_id, str(year)),
-        )
-        data = {"income": 0.0, "expense": 0.0}
-        for row in cur.fetchall():
-            data[row[0]] = float(row[1])
-        return data
+        return self._range_totals(user_id, *year_bounds(year))
+
+    def monthly_breakdown(self, user_id: int, year: int) -> Tuple[List[float], List[float]]:
+        """Return (income, expense) lists indexed by month 0..11 for `year`, in one pass."""
+        income, expense = [0.0] * 12, [0.0] * 12
+        with self._reading() as conn:
+            rows = self._exec(conn, self._SQL_MONTHLY_BREAKDOWN, (user_id, *year_bounds(year))).fetchall()
+        for month, inc, exp in rows:
+            income[month - 1], expense[month - 1] = float(inc), float(exp)
+        return income, expense
 
     def category_month_expense(self, user_id: int, category: str, month: str) -> float:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT COALESCE(SUM(amount),0)
-            FROM transactions
-            WHERE user_id = ? AND ttype='expense' AND category = ? AND substr(tdate,1,7) = ?
-            """,
-            (user_id, category, month),
-        )
-        return float(cur.fetchone()[0])
+        with self._reading() as conn:
+            cur = self._exec(conn, self._SQL_CATEGORY_MONTH_EXPENSE, (user_id, category, *month_bounds(month)))
+            return float(cur.fetchone()[0])
+
+    def category_month_expenses(self, user_id: int, month: str) -> Dict[str, float]:
+        """Return {category: total expense} for `month` in a single GROUP BY query."""
+        with self._reading() as conn:
+            cur = self._exec(conn, self._SQL_CATEGORY_MONTH_EXPENSES, (user_id, *month_bounds(month)))
+            return {row[0]: float(row[1]) for row in cur.fetchall()}
 
     # ------------------------- Budgets ------------------------
     def set_budget(self, user_id: int, category: str, month: str, monthly_limit: float) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO budgets(user_id, category, month, monthly_limit)
-            VALUES(?,?,?,?)
-            ON CONFLICT(user_id, category, month)
-            DO UPDATE SET monthly_limit = excluded.monthly_limit
-            """,
-            (user_id, category, month, monthly_limit),
-        )
-        self.conn.commit()
+        with self._writing() as conn:
+            self._exec(conn, self._SQL_SET_BUDGET, (user_id, category, month, monthly_limit))
 
     def get_budget(self, user_id: int, category: str, month: str) -> Optional[float]:
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT monthly_limit FROM budgets WHERE user_id = ? AND category = ? AND month = ?",
-            (user_id, category, month),
-        )
-        row = cur.fetchone()
+        with self._reading() as conn:
+            row = self._exec(conn, self._SQL_GET_BUDGET, (user_id, category, month)).fetchone()
         return float(row[0]) if row else None
 
     def list_budgets(self, user_id: int, month: Optional[str] = None) -> List[sqlite3.Row]:
-        cur = self.conn.cursor()
-        if month:
-            cur.execute("SELECT * FROM budgets WHERE user_id = ? AND month = ? ORDER BY category", (user_id, month))
-        else:
-            cur.execute("SELECT * FROM budgets WHERE user_id = ? ORDER BY month DESC, category", (user_id,))
-        return cur.fetchall()
+        with self._reading() as conn:
+            if month:
+                cur = self._exec(conn, self._SQL_LIST_BUDGETS_MONTH, (user_id, month))
+            else:
+                cur = self._exec(conn, self._SQL_LIST_BUDGETS_ALL, (user_id,))
+            return cur.fetchall()
 
 # ----------------------------- Services -------------------------------------
 
@@ -266,9 +605,11 @@ class AuthService:
         self.db = db
 
     def register(self, username: str, password: str) -> int:
-        if self.db.get_user(username):
-            raise ValueError("Username already exists.")
-        return self.db.create_user(username, password)
+        # The UNIQUE constraint on users.username is the uniqueness check.
+        try:
+            return self.db.create_user(username, password)
+        except sqlite3.IntegrityError:
+            raise ValueError("Username already exists.") from None
 
     def login(self, username: str, password: str) -> Optional[int]:
         row = self.db.get_user(username)
@@ -303,74 +644,112 @@ class ReportService:
         self.db = db
 
     def monthly_report(self, user_id: int, month: str) -> Dict[str, float]:
-        totals = self.db.month_totals(user_id, month)
-        savings = totals["income"] - totals["expense"]
-        return {**totals, "savings": savings}
+        return self.db.month_totals(user_id, month)
 
     def yearly_report(self, user_id: int, year: int) -> Dict[str, float]:
-        totals = self.db.year_totals(user_id, year)
-        savings = totals["income"] - totals["expense"]
-        return {**totals, "savings": savings}
+        return self.db.year_totals(user_id, year)
+
+    def yearly_breakdown(self, user_id: int, year: int) -> List[Dict[str, float]]:
+        """Per-month income/expense/savings for `year` (12 entries, January first)."""
+        income, expense = self.db.monthly_breakdown(user_id, year)
+        return [{"income": i, "expense": e, "savings": i - e} for i, e in zip(income, expense)]
 
 
 class BackupService:
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+    def __init__(self, db: Database):
+        self.db = db
 
     def backup(self, dest_dir: str) -> str:
         os.makedirs(dest_dir, exist_ok=True)
         ts = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
-        dest = os.path.join(dest_dir, f"pfm-backup-{ts}.sqlite3")
-        shutil.copy2(self.db_path, dest)
-        return dest
+        dest_path = os.path.join(dest_dir, f"pfm-backup-{ts}.sqlite3")
+        # Page-level copy through SQLite's online backup API; consistent even
+        # while the live database is in WAL mode.
+        dest = sqlite3.connect(dest_path)
+        try:
+            with self.db.exclusive() as conn:
+                conn.backup(dest, pages=1024, sleep=0.005)
+        finally:
+            dest.close()
+        return dest_path
 
     def restore(self, backup_path: str) -> None:
         if not os.path.isfile(backup_path):
             raise FileNotFoundError("Backup file not found")
-        shutil.copy2(backup_path, self.db_path)
+        # Bring the backup up to date in a scratch copy first: if an old backup
+        # cannot be migrated, the live database has not been touched yet.
+        staged = sqlite3.connect(":memory:")
+        try:
+            src = sqlite3.connect(backup_path)
+            try:
+                src.backup(staged)
+            finally:
+                src.close()
+            _init_db(staged)
+            with self.db.exclusive() as conn:
+                staged.backup(conn, pages=1024, sleep=0.005)
+        finally:
+            staged.close()
 
 # ----------------------------- CLI ------------------------------------------
 
 class CLI:
+    TX_PAGE_SIZE = 50
+
     def __init__(self, db: Database):
         self.db = db
         self.auth = AuthService(db)
         self.budgets = BudgetService(db)
         self.reports = ReportService(db)
-        self.backup = BackupService(db.path)
+        self.backup = BackupService(db)
         self.user_id: Optional[int] = None
         self.username: Optional[str] = None
+        self._running = False
+        # Menu choice -> handler tables, built once.
+        self._auth_actions = {"1": self._handle_register, "2": self._handle_login, "3": self._exit}
+        self._main_actions = {
+            "1": self._menu_transactions,
+            "2": self._menu_budgets,
+            "3": self._menu_reports,
+            "4": self._menu_backup_restore,
+            "5": self._logout,
+            "6": self._exit,
+        }
+        self._tx_actions = {"1": self._tx_add, "2": self._tx_list, "3": self._tx_update, "4": self._tx_delete}
+        self._budget_actions = {"1": self._budget_set, "2": self._budget_list}
+        self._report_actions = {"1": self._report_monthly, "2": self._report_yearly}
+        self._backup_actions = {"1": self._backup_db, "2": self._restore_db}
 
     # ---- Entry ----
     def start(self):
         self._welcome()
-        while True:
+        self._running = True
+        while self._running:
             if not self.user_id:
-                choice = self._menu_auth()
-                if choice == "1":
-                    self._handle_register()
-                elif choice == "2":
-                    self._handle_login()
-                elif choice == "3":
-                    print("Goodbye!")
-                    break
+                action = self._auth_actions.get(self._menu_auth())
             else:
-                choice = self._menu_main()
-                if choice == "1":
-                    self._menu_transactions()
-                elif choice == "2":
-                    self._menu_budgets()
-                elif choice == "3":
-                    self._menu_reports()
-                elif choice == "4":
-                    self._menu_backup_restore()
-                elif choice == "5":
-                    print(f"User '{self.username}' logged out.")
-                    self.user_id = None
-                    self.username = None
-                elif choice == "6":
-                    print("Goodbye!")
-                    break
+                action = self._main_actions.get(self._menu_main())
+            if action:
+                action()
+
+    def _submenu(self, menu: str, actions: Dict[str, Callable[[], None]], back: str):
+        while True:
+            print(menu)
+            choice = input("Select: ").strip()
+            if choice == back:
+                break
+            action = actions.get(choice)
+            if action:
+                action()
+
+    def _logout(self):
+        print(f"User '{self.username}' logged out.")
+        self.user_id = None
+        self.username = None
+
+    def _exit(self):
+        print("Goodbye!")
+        self._running = False
 
     def _welcome(self):
         print("\nPersonal Finance Manager\n" + "-" * 27)
@@ -428,19 +807,7 @@ class CLI:
 
     # ---- Transactions ----
     def _menu_transactions(self):
-        while True:
-            print("\nTransactions:\n1) Add\n2) List\n3) Update\n4) Delete\n5) Back")
-            choice = input("Select: ").strip()
-            if choice == "1":
-                self._tx_add()
-            elif choice == "2":
-                self._tx_list()
-            elif choice == "3":
-                self._tx_update()
-            elif choice == "4":
-                self._tx_delete()
-            elif choice == "5":
-                break
+        self._submenu("\nTransactions:\n1) Add\n2) List\n3) Update\n4) Delete\n5) Back", self._tx_actions, "5")
 
     def _tx_add(self):
         print("\n== Add Transaction ==")
@@ -450,7 +817,7 @@ class CLI:
             return
         category = input("Category (e.g., Salary, Rent, Food): ").strip()
         amount = input_float("Amount: ", min_value=0.0)
-        today = dt.date.today().strftime(DATE_FMT)
+        today, _month, _year = _today_strs()
         tdate = input_date("Date", default=today)
         note = input("Note (optional): ").strip()
         tid = self.db.add_transaction(self.user_id, ttype, category, amount, tdate, note)
@@ -466,13 +833,30 @@ class CLI:
     def _tx_list(self):
         print("\n== List Transactions ==")
         month = input(f"Month filter (YYYY-MM) or Enter for all: ").strip() or None
-        rows = self.db.list_transactions(self.user_id, month)
-        if not rows:
-            print("  (no transactions)")
+        if month and not _valid_month(month):
+            print("  ! Invalid month format.")
             return
-        print(f"  Showing {len(rows)} transactions:")
-        for r in rows:
-            print(f"  [{r['id']}] {r['tdate']} {r['ttype'].upper():7} {r['category']:<12} ${r['amount']:>8.2f} :: {r['note'] or ''}")
+        shown = 0
+        while True:
+            # One extra row tells us whether another page exists.
+            page = self.db.list_transactions(self.user_id, month, limit=self.TX_PAGE_SIZE + 1, offset=shown)
+            more = len(page) > self.TX_PAGE_SIZE
+            rows = page[:self.TX_PAGE_SIZE]
+            if not rows:
+                print("  (no transactions)")
+                return
+            if shown == 0 and not more:
+                lines = [f"  Showing {len(rows)} transactions:"]
+            else:
+                lines = [f"  Showing transactions {shown + 1}-{shown + len(rows)}:"]
+            lines += [
+                f"  [{r['id']}] {r['tdate']} {r['ttype'].upper():7} {r['category']:<12} ${r['amount']:>8.2f} :: {r['note'] or ''}"
+                for r in rows
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            shown += len(rows)
+            if not more or input("Next page? (Y/n): ").strip().lower() == 'n':
+                break
 
     def _tx_update(self):
         print("\n== Update Transaction ==")
@@ -504,25 +888,14 @@ class CLI:
 
     # ---- Budgets ----
     def _menu_budgets(self):
-        while True:
-            print("\nBudgets:\n1) Set/Update Monthly Budget\n2) List Budgets\n3) Back")
-            choice = input("Select: ").strip()
-            if choice == "1":
-                self._budget_set()
-            elif choice == "2":
-                self._budget_list()
-            elif choice == "3":
-                break
+        self._submenu("\nBudgets:\n1) Set/Update Monthly Budget\n2) List Budgets\n3) Back", self._budget_actions, "3")
 
     def _budget_set(self):
         print("\n== Set/Update Budget ==")
         category = input("Category (e.g., Food, Rent): ").strip()
-        today_month = dt.date.today().strftime(MONTH_FMT)
+        _today, today_month, _year = _today_strs()
         month = input(f"Month (YYYY-MM) [{today_month}]: ").strip() or today_month
-        # validate month
-        try:
-            dt.datetime.strptime(month, MONTH_FMT)
-        except ValueError:
+        if not _valid_month(month):
             print("  ! Invalid month format.")
             return
         limit_amt = input_float("Monthly limit: ", min_value=0.0)
@@ -532,38 +905,29 @@ class CLI:
     def _budget_list(self):
         print("\n== List Budgets ==")
         month = input("Month filter (YYYY-MM) or Enter for all: ").strip() or None
-        if month:
-            try:
-                dt.datetime.strptime(month, MONTH_FMT)
-            except ValueError:
-                print("  ! Invalid month format.")
-                return
+        if month and not _valid_month(month):
+            print("  ! Invalid month format.")
+            return
         rows = self.db.list_budgets(self.user_id, month)
         if not rows:
             print("  (no budgets)")
             return
-        for r in rows:
-            spent = self.db.category_month_expense(self.user_id, r['category'], r['month'])
-            print(f"  {r['month']} | {r['category']:<12} limit ${r['monthly_limit']:>8.2f} | spent ${spent:>8.2f}")
+        spent_by_month = {m: self.db.category_month_expenses(self.user_id, m) for m in {r['month'] for r in rows}}
+        lines = [
+            f"  {r['month']} | {r['category']:<12} limit ${r['monthly_limit']:>8.2f}"
+            f" | spent ${spent_by_month[r['month']].get(r['category'], 0.0):>8.2f}"
+            for r in rows
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # ---- Reports ----
     def _menu_reports(self):
-        while True:
-            print("\nReports:\n1) Monthly\n2) Yearly\n3) Back")
-            choice = input("Select: ").strip()
-            if choice == "1":
-                self._report_monthly()
-            elif choice == "2":
-                self._report_yearly()
-            elif choice == "3":
-                break
+        self._submenu("\nReports:\n1) Monthly\n2) Yearly\n3) Back", self._report_actions, "3")
 
     def _report_monthly(self):
-        today_month = dt.date.today().strftime(MONTH_FMT)
+        _today, today_month, _year = _today_strs()
         month = input(f"Month (YYYY-MM) [{today_month}]: ").strip() or today_month
-        try:
-            dt.datetime.strptime(month, MONTH_FMT)
-        except ValueError:
+        if not _valid_month(month):
             print("  ! Invalid month format.")
             return
         totals = self.reports.monthly_report(self.user_id, month)
@@ -573,7 +937,8 @@ class CLI:
         print(f"  Savings: ${totals['savings']:.2f}")
 
     def _report_yearly(self):
-        year = input(f"Year (YYYY) [{dt.date.today().year}]: ").strip() or str(dt.date.today().year)
+        _today, _month, this_year = _today_strs()
+        year = input(f"Year (YYYY) [{this_year}]: ").strip() or str(this_year)
         if not (year.isdigit() and len(year) == 4):
             print("  ! Invalid year.")
             return
@@ -582,30 +947,36 @@ class CLI:
         print(f"  Income : ${totals['income']:.2f}")
         print(f"  Expense: ${totals['expense']:.2f}")
         print(f"  Savings: ${totals['savings']:.2f}")
+        lines = [
+            f"  {calendar.month_abbr[m]}  in ${b['income']:>9.2f}  out ${b['expense']:>9.2f}  net ${b['savings']:>9.2f}"
+            for m, b in enumerate(self.reports.yearly_breakdown(self.user_id, int(year)), 1)
+            if b['income'] or b['expense']
+        ]
+        if lines:
+            sys.stdout.write("  By month:\n" + "\n".join(lines) + "\n")
 
     # ---- Backup / Restore ----
     def _menu_backup_restore(self):
-        while True:
-            print("\nBackup/Restore:\n1) Backup DB\n2) Restore DB\n3) Back")
-            choice = input("Select: ").strip()
-            if choice == "1":
-                dest = input("Destination folder (will be created if missing): ").strip() or "backups"
-                path = self.backup.backup(dest)
-                print(f"  ✓ Backup saved to: {path}")
-            elif choice == "2":
-                backup_path = input("Path to backup file: ").strip()
-                try:
-                    self.backup.restore(backup_path)
-                    print("  ✓ Restore complete. Please restart the app.")
-                except Exception as e:
-                    print(f"  ! Restore failed: {e}")
-            elif choice == "3":
-                break
+        self._submenu("\nBackup/Restore:\n1) Backup DB\n2) Restore DB\n3) Back", self._backup_actions, "3")
+
+    def _backup_db(self):
+        dest = input("Destination folder (will be created if missing): ").strip() or "backups"
+        path = self.backup.backup(dest)
+        print(f"  ✓ Backup saved to: {path}")
+
+    def _restore_db(self):
+        backup_path = input("Path to backup file: ").strip()
+        try:
+            self.backup.restore(backup_path)
+            print("  ✓ Restore complete. Please restart the app.")
+        except Exception as e:
+            print(f"  ! Restore failed: {e}")
 
 # ----------------------------- Tests ----------------------------------------
 
 def run_tests():
     import unittest
+    global PBKDF2_ITERS
     class PFMBasicTests(unittest.TestCase):
         def setUp(self):
             self.tmp_db = Database(":memory:")
@@ -620,12 +991,37 @@ def run_tests():
             uid = self.cli.auth.login(self.username, self.password)
             self.assertIsNotNone(uid)
 
+        def test_login_wrong_password(self):
+            self.assertIsNone(self.cli.auth.login(self.username, 'wrong'))
+
+        def test_register_duplicate_username(self):
+            with self.assertRaises(ValueError):
+                self.cli.auth.register(self.username, 'other')
+            # The failed INSERT must not leave a transaction open.
+            self.tmp_db.add_transactions_bulk(self.user_id, [('income', 'Salary', 1.0, '2025-01-01', '')])
+            self.assertEqual(len(self.tmp_db.list_transactions(self.user_id)), 1)
+
+        def test_verify_passwords_batch(self):
+            salt, pwd_hash = hash_password('pw')
+            results = verify_passwords([('pw', salt, pwd_hash), ('nope', salt, pwd_hash)])
+            self.assertEqual(results, [True, False])
+
+        def test_pbkdf2_iters_env(self):
+            import io
+            from unittest import mock
+            for raw, expected in [('5000', 5000), ('abc', 200_000), ('0', 200_000)]:
+                with mock.patch.dict(os.environ, {'PFM_PBKDF2_ITERS': raw}), \
+                     mock.patch('sys.stderr', new_callable=io.StringIO) as err:
+                    self.assertEqual(_pbkdf2_iters_from_env(), expected)
+                self.assertEqual(bool(err.getvalue()), expected == 200_000)
+
         def test_add_income_expense_and_reports(self):
-            # Add income
             today = dt.date.today().strftime(DATE_FMT)
-            self.tmp_db.add_transaction(self.user_id, 'income', 'Salary', 3000.0, today, 'Monthly salary')
-            # Add expense
-            self.tmp_db.add_transaction(self.user_id, 'expense', 'Food', 200.0, today, 'Groceries')
+            # Add income and expense
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('income', 'Salary', 3000.0, today, 'Monthly salary'),
+                ('expense', 'Food', 200.0, today, 'Groceries'),
+            ])
             month = today[:7]
             rep = self.cli.reports.monthly_report(self.user_id, month)
             self.assertAlmostEqual(rep['income'], 3000.0)
@@ -642,8 +1038,208 @@ def run_tests():
             self.assertIsNotNone(msg)
             self.assertIn('Budget exceeded', msg)
 
+        def test_date_and_month_validation(self):
+            self.assertTrue(_valid_date('2024-02-29'))
+            self.assertFalse(_valid_date('2023-02-29'))
+            self.assertFalse(_valid_date('2024-13-01'))
+            self.assertFalse(_valid_date('2024-1-05'))
+            self.assertFalse(_valid_date('2024-01-05x'))
+            self.assertTrue(_valid_month('2025-12'))
+            self.assertFalse(_valid_month('2025-00'))
+            self.assertFalse(_valid_month('2025-9'))
+
+        def test_month_and_year_ranges(self):
+            self.assertEqual(month_bounds('2024-12'), (_to_days('2024-12-01'), _to_days('2025-01-01')))
+            for bad in ('abc', '2024-13', '2024-1'):
+                with self.assertRaises(ValueError):
+                    month_bounds(bad)
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('expense', 'Food', 10.0, '2024-11-30', ''),
+                ('expense', 'Food', 20.0, '2024-12-31', ''),
+                ('expense', 'Food', 40.0, '2025-01-01', ''),
+            ])
+            self.assertAlmostEqual(self.cli.reports.monthly_report(self.user_id, '2024-12')['expense'], 20.0)
+            self.assertAlmostEqual(self.cli.reports.yearly_report(self.user_id, 2024)['expense'], 30.0)
+            self.assertAlmostEqual(self.tmp_db.category_month_expense(self.user_id, 'Food', '2025-01'), 40.0)
+
+        def test_extreme_years(self):
+            self.tmp_db.add_transaction(self.user_id, 'expense', 'Food', 8.0, '9999-12-31', '')
+            self.tmp_db.set_budget(self.user_id, 'Food', '9999-12', 5.0)
+            self.assertAlmostEqual(self.cli.reports.yearly_report(self.user_id, 9999)['expense'], 8.0)
+            self.assertAlmostEqual(self.cli.reports.monthly_report(self.user_id, '9999-12')['expense'], 8.0)
+            self.assertIn('Budget exceeded', self.cli.budgets.check_and_warn(self.user_id, 'Food', '9999-12'))
+            self.assertEqual(self.tmp_db.list_transactions(self.user_id, '9999-12')[0]['tdate'], '9999-12-31')
+            self.assertEqual(self.cli.reports.yearly_report(self.user_id, 0),
+                             {'income': 0.0, 'expense': 0.0, 'savings': 0.0})
+            self.assertEqual(self.tmp_db.category_month_expenses(self.user_id, '0000-01'), {})
+
+        def test_yearly_breakdown(self):
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('income', 'Salary', 1000.0, '2024-01-31', ''),
+                ('expense', 'Food', 30.0, '2024-01-02', ''),
+                ('expense', 'Food', 70.0, '2024-12-31', ''),
+                ('expense', 'Food', 99.0, '2025-01-01', ''),
+            ])
+            months = self.cli.reports.yearly_breakdown(self.user_id, 2024)
+            self.assertEqual(len(months), 12)
+            self.assertEqual(months[0], {'income': 1000.0, 'expense': 30.0, 'savings': 970.0})
+            self.assertEqual(months[11]['expense'], 70.0)
+            self.assertEqual(sum(m['expense'] for m in months[1:11]), 0.0)
+
+        def test_category_month_expenses(self):
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('expense', 'Food', 15.0, '2025-03-02', ''),
+                ('expense', 'Food', 5.0, '2025-03-20', ''),
+                ('expense', 'Rent', 900.0, '2025-03-01', ''),
+                ('income', 'Salary', 3000.0, '2025-03-01', ''),
+            ])
+            totals = self.tmp_db.category_month_expenses(self.user_id, '2025-03')
+            self.assertEqual(totals, {'Food': 20.0, 'Rent': 900.0})
+
+        def test_list_transactions_pagination(self):
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('expense', 'Food', float(day), f'2025-04-{day:02d}', '') for day in range(1, 8)
+            ])
+            first = self.tmp_db.list_transactions(self.user_id, limit=3)
+            self.assertEqual([r['tdate'] for r in first], ['2025-04-07', '2025-04-06', '2025-04-05'])
+            last = self.tmp_db.list_transactions(self.user_id, '2025-04', limit=3, offset=6)
+            self.assertEqual([r['tdate'] for r in last], ['2025-04-01'])
+
+        def test_tx_list_no_empty_trailing_page(self):
+            import io
+            from unittest import mock
+            self.cli.user_id = self.user_id
+            self.tmp_db.add_transactions_bulk(self.user_id, [
+                ('expense', 'Food', 1.0, f'2025-04-0{day}', '') for day in range(1, 5)
+            ])
+            prompts = []
+            answers = iter(['', ''])
+            with mock.patch.object(CLI, 'TX_PAGE_SIZE', 2), \
+                 mock.patch('builtins.input', lambda p='': prompts.append(p) or next(answers)), \
+                 mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+                self.cli._tx_list()
+            # Two full pages: one "Next page?" prompt between them, none after the last.
+            self.assertEqual(sum(p.startswith('Next page') for p in prompts), 1)
+            self.assertIn('Showing transactions 3-4:', out.getvalue())
+
+        def test_backup_and_restore(self):
+            import tempfile
+            today = dt.date.today().strftime(DATE_FMT)
+            self.tmp_db.add_transaction(self.user_id, 'income', 'Salary', 100.0, today)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = self.cli.backup.backup(tmp)
+                self.tmp_db.add_transaction(self.user_id, 'income', 'Bonus', 50.0, today)
+                self.cli.backup.restore(path)
+            rows = self.tmp_db.list_transactions(self.user_id)
+            self.assertEqual([r['category'] for r in rows], ['Salary'])
+
+        def test_database_with_pool(self):
+            import tempfile
+            import time
+            with tempfile.TemporaryDirectory() as tmp:
+                pool = DatabasePool(os.path.join(tmp, 'pool.sqlite3'), readers=2)
+                try:
+                    db = Database(pool=pool)
+                    cli = CLI(db)
+                    uid = cli.auth.register('bob', 'pw')
+                    self.assertEqual(cli.auth.login('bob', 'pw'), uid)
+                    db.add_transactions_bulk(uid, [
+                        ('income', 'Salary', 500.0, '2025-05-01', ''),
+                        ('expense', 'Food', 120.0, '2025-05-02', ''),
+                    ])
+                    db.set_budget(uid, 'Food', '2025-05', 100.0)
+                    self.assertIn('Budget exceeded', cli.budgets.check_and_warn(uid, 'Food', '2025-05'))
+                    # Reads from several threads at once, each on its own pooled reader.
+                    with ThreadPoolExecutor(max_workers=4) as ex:
+                        reports = list(ex.map(lambda _: cli.reports.monthly_report(uid, '2025-05'), range(8)))
+                    self.assertTrue(all(r['savings'] == 380.0 for r in reports))
+                    with pool.read() as conn:
+                        self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+                        with self.assertRaises(sqlite3.OperationalError):
+                            conn.execute("DELETE FROM users")
+                    # Backup waits for a write in progress rather than copying beside it.
+                    with ThreadPoolExecutor(max_workers=1) as ex:
+                        with pool.write() as conn:
+                            conn.execute("UPDATE budgets SET monthly_limit = 200.0")
+                            pending = ex.submit(cli.backup.backup, os.path.join(tmp, 'bk'))
+                            time.sleep(0.05)
+                            self.assertFalse(pending.done())
+                        backup_path = pending.result(timeout=5)
+                    db.set_budget(uid, 'Food', '2025-05', 300.0)
+                    cli.backup.restore(backup_path)
+                    self.assertEqual(db.get_budget(uid, 'Food', '2025-05'), 200.0)
+                    # close() also reaches readers that are out on loan.
+                    with pool.read() as conn:
+                        pool.close()
+                        with self.assertRaises(sqlite3.ProgrammingError):
+                            conn.execute("SELECT 1")
+                finally:
+                    pool.close()
+
+        def _write_v0_db(self, path, tdate):
+            """Create a database in the pre-migration layout, with one transaction on `tdate`."""
+            old = sqlite3.connect(path)
+            old.executescript(f"""
+                CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL,
+                    salt BLOB NOT NULL, password_hash BLOB NOT NULL, created_at TEXT NOT NULL);
+                CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL,
+                    ttype TEXT NOT NULL, category TEXT NOT NULL, amount REAL NOT NULL, tdate TEXT NOT NULL, note TEXT);
+                CREATE TABLE budgets (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER NOT NULL,
+                    category TEXT NOT NULL, month TEXT NOT NULL, monthly_limit REAL NOT NULL,
+                    UNIQUE(user_id, category, month));
+                INSERT INTO users VALUES (1, 'old', x'00', x'00', '2024-01-01');
+                INSERT INTO transactions VALUES (1, 1, 'expense', 'Food', 12.5, '2024-02-29', 'leap');
+                INSERT INTO transactions VALUES (2, 1, 'expense', 'Food', 7.5, '{tdate}', '');
+                INSERT INTO budgets VALUES (1, 1, 'Food', '2025-9', 5.0);
+            """)
+            old.close()
+
+        def test_migrates_text_dates(self):
+            import tempfile
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'old.sqlite3')
+                # strptime accepted dates without zero padding.
+                self._write_v0_db(path, '2025-9-5')
+                db = Database(path)
+                try:
+                    rows = db.list_transactions(1)
+                    self.assertEqual([r['tdate'] for r in rows], ['2025-09-05', '2024-02-29'])
+                    self.assertAlmostEqual(db.month_totals(1, '2024-02')['expense'], 12.5)
+                    self.assertAlmostEqual(db.month_totals(1, '2025-09')['expense'], 7.5)
+                    self.assertEqual(db.get_budget(1, 'Food', '2025-09'), 5.0)
+                finally:
+                    db.conn.close()
+
+        def test_restore_migrates_old_backup(self):
+            import tempfile
+            with tempfile.TemporaryDirectory() as tmp:
+                good = os.path.join(tmp, 'good.sqlite3')
+                self._write_v0_db(good, '2025-9-5')
+                self.cli.backup.restore(good)
+                self.assertEqual(len(self.tmp_db.list_transactions(1)), 2)
+                bad = os.path.join(tmp, 'bad.sqlite3')
+                self._write_v0_db(bad, 'garbage')
+                with self.assertRaises(ValueError):
+                    self.cli.backup.restore(bad)
+            # The failed restore left the previously restored data in place.
+            self.assertEqual(len(self.tmp_db.list_transactions(1)), 2)
+
+        def test_bulk_insert_rolls_back_on_error(self):
+            today = dt.date.today().strftime(DATE_FMT)
+            with self.assertRaises(sqlite3.IntegrityError):
+                self.tmp_db.add_transactions_bulk(self.user_id, [
+                    ('expense', 'Food', 10.0, today, ''),
+                    ('expense', 'Food', -5.0, today, ''),  # violates CHECK(amount >= 0)
+                ])
+            self.assertEqual(len(self.tmp_db.list_transactions(self.user_id)), 0)
+
     suite = unittest.defaultTestLoader.loadTestsFromTestCase(PFMBasicTests)
-    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    # Full-strength hashing dominates setUp time; it is not what these tests cover.
+    saved_iters, PBKDF2_ITERS = PBKDF2_ITERS, 1000
+    try:
+        result = unittest.TextTestRunner(verbosity=2).run(suite)
+    finally:
+        PBKDF2_ITERS = saved_iters
     return 0 if result.wasSuccessful() else 1
 
 # ----------------------------- Main -----------------------------------------